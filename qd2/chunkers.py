@@ -15,6 +15,25 @@ from utils import (
 )
 
 
+# The chunkers build every ChunkPayload field themselves from
+# already-validated inputs (dates come out of date_to_day_range /
+# extract_date_from_timestamp, enums are enum members), so the validating
+# constructor re-checks known-good data. model_construct skips that work;
+# flip to False to restore full validation when debugging payload shapes.
+_USE_FAST_CONSTRUCT = True
+_new_payload = ChunkPayload.model_construct if _USE_FAST_CONSTRUCT else ChunkPayload
+
+# Enum members resolved once at import — attribute access on an Enum class
+# routes through EnumMeta, which is measurable at per-chunk call volumes
+_SRC_PROFILE, _SRC_MEALS, _SRC_FITNESS, _SRC_SLEEP = (
+    Source.PROFILE, Source.MEALS, Source.FITNESS, Source.SLEEP
+)
+_SEC_SUMMARY, _SEC_MEAL, _SEC_RECOMMENDATION, _SEC_HOUR = (
+    Section.SUMMARY, Section.MEAL, Section.RECOMMENDATION, Section.HOUR
+)
+_RT_DAILY = ReportType.DAILY
+
+
 # ============================================================================
 # Profile chunker
 # ============================================================================
@@ -45,54 +64,39 @@ def chunk_profile(profile: ProfileInput) -> List[ProcessedChunk]:
     # Calculate BMI
     bmi = calculate_bmi(profile.height, profile.weight)
     
-    # Build text
-    text_parts = [
-        f"Profile for {full_name or 'Unknown'} (ID: {profile.patient_id}):"
+    # Build text: each section renders to a string (or "" when absent) and
+    # the final text is assembled in one join pass — no per-line appends
+    anthro_parts = [
+        part for part in (
+            f"height {profile.height} cm" if profile.height else "",
+            f"weight {profile.weight} kg" if profile.weight else "",
+            f"waist {profile.waist} cm" if profile.waist else "",
+            f"BMI {bmi}" if bmi else "",
+        ) if part
     ]
-    
-    if profile.dob or profile.gender:
-        text_parts.append(
-            f"DOB: {safe_str(profile.dob)}, Gender: {safe_str(profile.gender)}."
-        )
-    
-    # Anthropometrics
-    anthro_parts = []
-    if profile.height:
-        anthro_parts.append(f"height {profile.height} cm")
-    if profile.weight:
-        anthro_parts.append(f"weight {profile.weight} kg")
-    if profile.waist:
-        anthro_parts.append(f"waist {profile.waist} cm")
-    if bmi:
-        anthro_parts.append(f"BMI {bmi}")
-    
-    if anthro_parts:
-        text_parts.append(f"Anthro: {', '.join(anthro_parts)}.")
-    
-    # Contact
-    if profile.email or profile.phone_number:
-        text_parts.append(
-            f"Contact: {safe_str(profile.email)}, {safe_str(profile.phone_number)}."
-        )
-    
-    # Profile completion
+
     completion_str = format_profile_completion(profile.profile_completion)
-    text_parts.append(f"Profile completion: {completion_str}.")
-    
-    # Locale and created
-    text_parts.append(
+
+    text_parts = (
+        f"Profile for {full_name or 'Unknown'} (ID: {profile.patient_id}):",
+        f"DOB: {safe_str(profile.dob)}, Gender: {safe_str(profile.gender)}."
+        if profile.dob or profile.gender else "",
+        f"Anthro: {', '.join(anthro_parts)}." if anthro_parts else "",
+        f"Contact: {safe_str(profile.email)}, {safe_str(profile.phone_number)}."
+        if profile.email or profile.phone_number else "",
+        f"Profile completion: {completion_str}.",
         f"Locale: {safe_str(profile.locale, 'Unknown')}; "
-        f"Created: {safe_str(profile.created_at)}."
+        f"Created: {safe_str(profile.created_at)}.",
     )
-    
-    text = " ".join(text_parts)
+
+    text = " ".join(part for part in text_parts if part)
     
     # Build payload
-    payload = ChunkPayload(
+    payload = _new_payload(
         patient_id=profile.patient_id,
         full_name=full_name,
-        source=Source.PROFILE,
-        section=Section.SUMMARY,
+        source=_SRC_PROFILE,
+        section=_SEC_SUMMARY,
         report_type=None,
         date=None,
         start_ts=None,
@@ -109,6 +113,38 @@ def chunk_profile(profile: ProfileInput) -> List[ProcessedChunk]:
 # Meals chunker
 # ============================================================================
 
+# Macro-nutrient rendering table, shared by the daily-totals and per-meal
+# blocks: one (field, format) pass replaces the hand-rolled if-chains
+_MACRO_FIELDS = (
+    ("calories", "{} kcal"),
+    ("proteins", "P {}g"),
+    ("carbohydrates", "C {}g"),
+    ("fats", "F {}g"),
+    ("fiber", "Fiber {}g"),
+)
+_MACRO_KEY_SET = frozenset(key for key, _ in _MACRO_FIELDS)
+
+# Same table style for the diet-recommendation chunk
+_REC_FIELDS = (
+    ("total_calories", "Target calories: {} kcal."),
+    ("proteins", "Target proteins: {}g."),
+    ("carbohydrates", "Target carbs: {}g."),
+    ("fats", "Target fats: {}g."),
+)
+
+# Micro-nutrient display names, memoized — the dataset has a few dozen
+# distinct keys, so after the first meals the replace/title work is gone
+_MICRO_DISPLAY_CACHE: dict = {}
+
+
+def _pretty_micro(key: str) -> str:
+    """Format a micro-nutrient key for display (calcium_mg -> Calcium)."""
+    display = _MICRO_DISPLAY_CACHE.get(key)
+    if display is None:
+        display = key.replace("_mg", "").replace("_", " ").title()
+        _MICRO_DISPLAY_CACHE[key] = display
+    return display
+
 def chunk_meals(meal_data: MealInput) -> List[ProcessedChunk]:
     """
     Create chunks for daily meal data.
@@ -132,6 +168,18 @@ def chunk_meals(meal_data: MealInput) -> List[ProcessedChunk]:
     except ValueError:
         return []  # Skip if date is invalid
     
+    # Fields shared by every chunk of this day — built once instead of
+    # repeated per ChunkPayload (a day can carry many per-meal chunks)
+    common_fields = {
+        "patient_id": meal_data.patient_id,
+        "full_name": None,
+        "source": _SRC_MEALS,
+        "report_type": _RT_DAILY,
+        "date": meal_data.date,
+        "start_ts": start_ts,
+        "end_ts": end_ts,
+    }
+
     # === Day summary chunk ===
     summary_parts = [
         f"Meals summary for {meal_data.date}:"
@@ -142,36 +190,24 @@ def chunk_meals(meal_data: MealInput) -> List[ProcessedChunk]:
     else:
         summary_parts.append("No meals logged.")
     
-    # Daily totals
-    totals = []
-    if meal_data.calories:
-        totals.append(f"{meal_data.calories} kcal")
-    if meal_data.proteins:
-        totals.append(f"P {meal_data.proteins}g")
-    if meal_data.carbohydrates:
-        totals.append(f"C {meal_data.carbohydrates}g")
-    if meal_data.fats:
-        totals.append(f"F {meal_data.fats}g")
-    if meal_data.fiber:
-        totals.append(f"Fiber {meal_data.fiber}g")
-    
+    # Daily totals (truthy values only, matching the old if-chain)
+    totals = [
+        fmt.format(value)
+        for key, fmt in _MACRO_FIELDS
+        if (value := getattr(meal_data, key))
+    ]
+
     if totals:
         summary_parts.append(f"Daily totals: {', '.join(totals)}.")
     
     summary_text = " ".join(summary_parts)
     
-    summary_payload = ChunkPayload(
-        patient_id=meal_data.patient_id,
-        full_name=None,
-        source=Source.MEALS,
-        section=Section.SUMMARY,
-        report_type=ReportType.DAILY,
-        date=meal_data.date,
-        start_ts=start_ts,
-        end_ts=end_ts,
+    summary_payload = _new_payload(
+        **common_fields,
+        section=_SEC_SUMMARY,
         text=summary_text
     )
-    
+
     summary_id = generate_meal_summary_id(meal_data.patient_id, meal_data.date)
     chunks.append(ProcessedChunk(point_id=summary_id, payload=summary_payload))
     
@@ -199,21 +235,17 @@ def chunk_meals(meal_data: MealInput) -> List[ProcessedChunk]:
                 item_strs.append(f"{item_name} ({item_qty})".strip())
             meal_text_parts.append(f"Items: {', '.join(item_strs)}.")
         
-        # Macros
+        # Macros (key presence, matching the old if-chain): one set
+        # intersection finds which table keys this meal actually carries
         macros = meal.get("total_macro_nutritional_value", {})
         if macros:
-            macro_parts = []
-            if "calories" in macros:
-                macro_parts.append(f"{macros['calories']} kcal")
-            if "proteins" in macros:
-                macro_parts.append(f"P {macros['proteins']}g")
-            if "carbohydrates" in macros:
-                macro_parts.append(f"C {macros['carbohydrates']}g")
-            if "fats" in macros:
-                macro_parts.append(f"F {macros['fats']}g")
-            if "fiber" in macros:
-                macro_parts.append(f"Fiber {macros['fiber']}g")
-            
+            present = macros.keys() & _MACRO_KEY_SET
+            macro_parts = [
+                fmt.format(macros[key])
+                for key, fmt in _MACRO_FIELDS
+                if key in present
+            ]
+
             if macro_parts:
                 meal_text_parts.append(f"Macros: {', '.join(macro_parts)}.")
         
@@ -223,9 +255,7 @@ def chunk_meals(meal_data: MealInput) -> List[ProcessedChunk]:
             micro_parts = []
             for key, value in micros.items():
                 if value and key != "_id":
-                    # Format key nicely (calcium_mg -> Ca)
-                    display_key = key.replace("_mg", "").replace("_", " ").title()
-                    micro_parts.append(f"{display_key} {value}mg")
+                    micro_parts.append(f"{_pretty_micro(key)} {value}mg")
             
             if micro_parts:
                 meal_text_parts.append(f"Micros: {', '.join(micro_parts[:6])}.")  # Limit length
@@ -239,15 +269,9 @@ def chunk_meals(meal_data: MealInput) -> List[ProcessedChunk]:
         
         meal_text = " ".join(meal_text_parts)
         
-        meal_payload = ChunkPayload(
-            patient_id=meal_data.patient_id,
-            full_name=None,
-            source=Source.MEALS,
-            section=Section.MEAL,
-            report_type=ReportType.DAILY,
-            date=meal_data.date,
-            start_ts=start_ts,
-            end_ts=end_ts,
+        meal_payload = _new_payload(
+            **common_fields,
+            section=_SEC_MEAL,
             text=meal_text
         )
         
@@ -258,27 +282,15 @@ def chunk_meals(meal_data: MealInput) -> List[ProcessedChunk]:
     if meal_data.diet_recommendations:
         rec = meal_data.diet_recommendations
         rec_parts = [f"Diet recommendations for {meal_data.date}:"]
-        
-        if "total_calories" in rec:
-            rec_parts.append(f"Target calories: {rec['total_calories']} kcal.")
-        if "proteins" in rec:
-            rec_parts.append(f"Target proteins: {rec['proteins']}g.")
-        if "carbohydrates" in rec:
-            rec_parts.append(f"Target carbs: {rec['carbohydrates']}g.")
-        if "fats" in rec:
-            rec_parts.append(f"Target fats: {rec['fats']}g.")
-        
+        rec_parts.extend(
+            fmt.format(rec[key]) for key, fmt in _REC_FIELDS if key in rec
+        )
+
         rec_text = " ".join(rec_parts)
         
-        rec_payload = ChunkPayload(
-            patient_id=meal_data.patient_id,
-            full_name=None,
-            source=Source.MEALS,
-            section=Section.RECOMMENDATION,
-            report_type=ReportType.DAILY,
-            date=meal_data.date,
-            start_ts=start_ts,
-            end_ts=end_ts,
+        rec_payload = _new_payload(
+            **common_fields,
+            section=_SEC_RECOMMENDATION,
             text=rec_text
         )
         
@@ -322,23 +334,29 @@ def chunk_fitness(fitness: FitnessInput, include_hourly: bool = False) -> List[P
     # Derive canonical date
     date = extract_date_from_timestamp(start_ts)
     
-    # Get report type safely
+    # Get report type safely (hoisted once; reused by summary and every
+    # hourly chunk below)
+    report_type = fitness.report_type or _RT_DAILY
     report_type_str = fitness.report_type.value if fitness.report_type else "daily"
-    
+
     # === Summary chunk ===
+    # Fixed prefix in one f-string; the list only carries the
+    # variable-length sections below
     summary_parts = [
-        f"Fitness {report_type_str} summary for {date}:"
+        f"Fitness {report_type_str} summary for {date}: "
+        f"Steps: {fitness.steps or 0}. "
+        f"Active duration: {fitness.active_duration or 0} min."
     ]
-    
-    summary_parts.append(f"Steps: {fitness.steps or 0}.")
-    summary_parts.append(f"Active duration: {fitness.active_duration or 0} min.")
-    
-    # Peak activity
+
+    # Peak activity (inline fallbacks; f-string stringifies either way)
     if fitness.peak_activity_time:
         peak = fitness.peak_activity_time
-        peak_hour = safe_str(peak.get("hour"), "Unknown")
-        peak_steps = safe_str(peak.get("max_steps"), "0")
-        summary_parts.append(f"Peak hour: {peak_hour} with {peak_steps} steps.")
+        peak_hour = peak.get("hour")
+        peak_steps = peak.get("max_steps")
+        summary_parts.append(
+            f"Peak hour: {'Unknown' if peak_hour is None else peak_hour} "
+            f"with {0 if peak_steps is None else peak_steps} steps."
+        )
     
     # Activity distribution
     if fitness.activity_distribution:
@@ -355,19 +373,20 @@ def chunk_fitness(fitness: FitnessInput, include_hourly: bool = False) -> List[P
             summary_parts.append(f"Distribution — {', '.join(dist_parts)}.")
     
     # Inactive periods
-    if fitness.inactive_periods and len(fitness.inactive_periods) > 0:
-        longest = max(fitness.inactive_periods, key=lambda x: x.get("duration", 0))
-        duration = longest.get("duration", 0)
+    if fitness.inactive_periods:
+        # Only the duration is reported, so take the max over durations
+        # directly instead of selecting the full period dict first
+        duration = max(p.get("duration", 0) for p in fitness.inactive_periods)
         summary_parts.append(f"Longest inactive: {duration} min.")
     
     summary_text = " ".join(summary_parts)
     
-    summary_payload = ChunkPayload(
+    summary_payload = _new_payload(
         patient_id=fitness.patient_id,
         full_name=None,
-        source=Source.FITNESS,
-        section=Section.SUMMARY,
-        report_type=fitness.report_type if fitness.report_type else ReportType.DAILY,
+        source=_SRC_FITNESS,
+        section=_SEC_SUMMARY,
+        report_type=report_type,
         date=date,
         start_ts=start_ts,
         end_ts=end_ts,
@@ -398,12 +417,12 @@ def chunk_fitness(fitness: FitnessInput, include_hourly: bool = False) -> List[P
             
             hour_text += ", ".join(hour_parts) + "."
             
-            hour_payload = ChunkPayload(
+            hour_payload = _new_payload(
                 patient_id=fitness.patient_id,
                 full_name=None,
-                source=Source.FITNESS,
-                section=Section.HOUR,
-                report_type=fitness.report_type if fitness.report_type else ReportType.DAILY,
+                source=_SRC_FITNESS,
+                section=_SEC_HOUR,
+                report_type=report_type,
                 date=date,
                 start_ts=start_ts,
                 end_ts=end_ts,
@@ -450,37 +469,35 @@ def chunk_sleep(sleep: SleepInput) -> List[ProcessedChunk]:
     
     date = extract_date_from_timestamp(start_ts)
     
-    # Get report type safely
+    # Get report type safely (hoisted once)
+    report_type = sleep.report_type or _RT_DAILY
     report_type_str = sleep.report_type.value if sleep.report_type else "daily"
     
-    # Build text
-    text_parts = [f"Sleep {report_type_str} report for {date}:"]
-    
+    # Build text: the part count is small and fixed, so one f-string
+    # replaces the list-append-join round trip
     if sleep.quality_analysis:
         qa = sleep.quality_analysis
         quality = qa.get("sleep_quality", "unknown")
         deep = qa.get("deep_sleep_percentage", 0)
         rem = qa.get("rem_sleep_percentage", 0)
         awake = qa.get("awake_time_percentage", 0)
-        
-        text_parts.append(
-            f"quality {quality}, deep {deep}%, REM {rem}%, awake {awake}%."
-        )
-        
+
+        qa_segment = f"quality {quality}, deep {deep}%, REM {rem}%, awake {awake}%."
+
         # Check for zero data
         if deep == 0 and rem == 0 and awake == 0:
-            text_parts.append("Total duration unavailable or zero.")
+            qa_segment += " Total duration unavailable or zero."
     else:
-        text_parts.append("No sleep records available.")
-    
-    text = " ".join(text_parts)
+        qa_segment = "No sleep records available."
+
+    text = f"Sleep {report_type_str} report for {date}: {qa_segment}"
     
-    payload = ChunkPayload(
+    payload = _new_payload(
         patient_id=sleep.patient_id,
         full_name=None,
-        source=Source.SLEEP,
-        section=Section.SUMMARY,
-        report_type=sleep.report_type if sleep.report_type else ReportType.DAILY,
+        source=_SRC_SLEEP,
+        section=_SEC_SUMMARY,
+        report_type=report_type,
         date=date,
         start_ts=start_ts,
         end_ts=end_ts,
@@ -14,6 +14,9 @@ class Settings(BaseSettings):
     qdrant_use_https: bool = False  # Set to True for Qdrant Cloud
     qdrant_collection_name: str = "people_data"
     qdrant_vector_size: int = 1536
+    qdrant_use_quantization: bool = True  # int8 scalar quantization (new collections only)
+    qdrant_hnsw_m: int = 32  # HNSW graph connectivity (new collections only)
+    qdrant_hnsw_ef_construct: int = 200  # HNSW build-time beam width
     
     # OpenAI Configuration
     openai_api_key: str
@@ -21,6 +24,10 @@ class Settings(BaseSettings):
     openai_llm_model: str = "gpt-4o-mini"
     openai_llm_temperature: float = 0.1
     openai_llm_max_tokens: int = 1000
+    llm_cache_ttl_seconds: int = 3600  # Answer cache TTL (0 disables)
+    llm_cache_size: int = 256  # Max cached answers
+    openai_llm_rpm: int = 0  # Client-side requests/minute cap (0 disables)
+    llm_context_char_budget: int = 24000  # Max evidence chars per prompt (0 disables)
     
     # PostgreSQL Configuration (optional - only needed for name resolution)
     postgres_host: str = "localhost"
@@ -40,10 +47,14 @@ class Settings(BaseSettings):
     # Batch Processing
     embedding_batch_size: int = 32  # Reduced for better reliability
     ingest_batch_size: int = 100
+    embedding_cache_size: int = 10000  # Content-hash LRU entries (0 disables)
+    embedding_concurrency: int = 4  # Parallel embedding batches (1 = serial)
     
     # Retrieval Configuration
     default_top_k: int = 10
     max_top_k: int = 50
+    name_resolution_cache_ttl_seconds: int = 300  # Resolved name TTL (0 disables)
+    name_resolution_cache_size: int = 256  # Max cached name resolutions
     
     model_config = SettingsConfigDict(
         env_file=".env",
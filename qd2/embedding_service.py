@@ -1,7 +1,12 @@
 """Embedding service using OpenAI."""
 
-from typing import List
-from openai import OpenAI
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from openai_client import get_openai_client
 from config import settings
 import structlog
 
@@ -10,77 +15,183 @@ logger = structlog.get_logger()
 
 class EmbeddingService:
     """Service for generating embeddings using OpenAI."""
-    
+
     def __init__(self):
-        """Initialize OpenAI client with extended timeout."""
-        self.client = OpenAI(
-            api_key=settings.openai_api_key,
-            timeout=120.0,  # 2 minutes timeout
-            max_retries=3   # Retry 3 times on failure
-        )
+        """Initialize with the shared OpenAI client."""
+        self.client = get_openai_client()
         self.model = settings.openai_embedding_model
         self.batch_size = settings.embedding_batch_size
-    
+
+        # Content-hash cache: identical texts (re-ingested reports, repeated
+        # boilerplate chunks, repeated queries) skip the API round-trip.
+        # Process-local LRU; Qdrant upserts stay idempotent either way.
+        # Vectors are stored as float32 arrays — ~6 KB per 1536-dim entry
+        # instead of ~50 KB as a list of Python floats.
+        self.cache_size = settings.embedding_cache_size
+        self._cache: "OrderedDict[bytes, array]" = OrderedDict()
+        # Guards the get/move_to_end and put/evict compounds: embed_texts
+        # runs concurrently from request threads against this singleton
+        self._cache_lock = threading.Lock()
+
+        # Bounded fan-out for large ingests: batches are independent API
+        # calls, so issuing them concurrently divides wall time by the
+        # concurrency (within rate limits). 1 keeps the old serial loop.
+        self.concurrency = max(1, settings.embedding_concurrency)
+
+    def _cache_key(self, text: str) -> bytes:
+        """Build cache key from model + text content."""
+        return hashlib.sha256(f"{self.model}|{text}".encode()).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[List[float]]:
+        """Look up cached embedding, refreshing LRU position."""
+        with self._cache_lock:
+            packed = self._cache.get(key)
+            if packed is None:
+                return None
+            self._cache.move_to_end(key)
+            return list(packed)
+
+    def _cache_put(self, key: bytes, vector: List[float]) -> None:
+        """Store embedding as float32, evicting least-recently-used entries."""
+        with self._cache_lock:
+            self._cache[key] = array("f", vector)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for a list of texts.
-        
-        Automatically batches requests if texts exceed batch_size.
-        
+
+        Texts already in the content-hash cache are served locally;
+        the rest are batched to the API (batch_size per request).
+
         Args:
             texts: List of text strings to embed
-            
+
         Returns:
-            List of embedding vectors
-            
+            List of embedding vectors (same order as input)
+
         Raises:
             Exception: If embedding generation fails
         """
         if not texts:
             return []
-        
-        all_embeddings = []
-        total_batches = (len(texts) + self.batch_size - 1) // self.batch_size
-        
-        # Process in batches
-        for batch_num, i in enumerate(range(0, len(texts), self.batch_size), 1):
-            batch = texts[i:i + self.batch_size]
-            
-            try:
-                logger.info(
-                    "Generating embeddings",
-                    batch=f"{batch_num}/{total_batches}",
-                    texts_in_batch=len(batch),
-                    total_texts=len(texts)
-                )
-                
-                response = self.client.embeddings.create(
-                    input=batch,
-                    model=self.model,
-                    timeout=120.0  # 2 minutes per batch
-                )
-                
-                # Extract embeddings in order
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
-                
-                logger.info(
-                    "✓ Embeddings generated successfully",
-                    batch=f"{batch_num}/{total_batches}",
-                    batch_size=len(batch),
-                    total_processed=len(all_embeddings)
-                )
-            
-            except Exception as e:
-                logger.error(
-                    "Embedding generation failed",
-                    batch_start=i,
-                    batch_size=len(batch),
-                    error=str(e)
-                )
-                raise
-        
-        return all_embeddings
+
+        results: List[Optional[List[float]]] = [None] * len(texts)
+
+        # Resolve cache hits and deduplicate what remains: repeated texts
+        # in one request (re-sent reports, boilerplate chunks) are embedded
+        # once and fanned back out to every position afterwards.
+        pending: List[str] = []
+        positions: dict = {}  # cache key -> indices awaiting that embedding
+        cache_hits = 0
+
+        for idx, text in enumerate(texts):
+            key = self._cache_key(text)
+
+            if self.cache_size > 0:
+                cached = self._cache_get(key)
+                if cached is not None:
+                    results[idx] = cached
+                    cache_hits += 1
+                    continue
+
+            indices = positions.get(key)
+            if indices is None:
+                positions[key] = [idx]
+                pending.append(text)
+            else:
+                indices.append(idx)
+
+        if cache_hits or len(pending) < len(texts) - cache_hits:
+            logger.info(
+                "Embedding requests collapsed",
+                cache_hits=cache_hits,
+                duplicates=len(texts) - cache_hits - len(pending),
+                total_texts=len(texts)
+            )
+
+        batches = [
+            pending[i:i + self.batch_size]
+            for i in range(0, len(pending), self.batch_size)
+        ]
+        total_batches = len(batches)
+
+        # Embed remaining batches, concurrently when there is more than one
+        if self.concurrency > 1 and total_batches > 1:
+            workers = min(self.concurrency, total_batches)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_results = list(executor.map(
+                    lambda args: self._embed_batch(args[0], args[1], total_batches, len(texts)),
+                    enumerate(batches, 1)
+                ))
+        else:
+            batch_results = [
+                self._embed_batch(batch_num, batch, total_batches, len(texts))
+                for batch_num, batch in enumerate(batches, 1)
+            ]
+
+        # Fan each unique embedding back out to all positions that need it
+        for batch, embeddings in zip(batches, batch_results):
+            for text, embedding in zip(batch, embeddings):
+                key = self._cache_key(text)
+                for idx in positions[key]:
+                    results[idx] = embedding
+                if self.cache_size > 0:
+                    self._cache_put(key, embedding)
+
+        return results
+
+    def _embed_batch(
+        self,
+        batch_num: int,
+        batch: List[str],
+        total_batches: int,
+        total_texts: int
+    ) -> List[List[float]]:
+        """
+        Embed a single batch via the API.
+
+        Args:
+            batch_num: 1-based batch number (for logging)
+            batch: Texts in this batch
+            total_batches: Total number of batches (for logging)
+            total_texts: Total texts in the overall request (for logging)
+
+        Returns:
+            List of embedding vectors for the batch
+        """
+        try:
+            logger.info(
+                "Generating embeddings",
+                batch=f"{batch_num}/{total_batches}",
+                texts_in_batch=len(batch),
+                total_texts=total_texts
+            )
+
+            response = self.client.embeddings.create(
+                input=batch,
+                model=self.model,
+                timeout=120.0  # 2 minutes per batch
+            )
+
+            logger.info(
+                "✓ Embeddings generated successfully",
+                batch=f"{batch_num}/{total_batches}",
+                batch_size=len(batch)
+            )
+
+            return [item.embedding for item in response.data]
+
+        except Exception as e:
+            logger.error(
+                "Embedding generation failed",
+                batch=f"{batch_num}/{total_batches}",
+                batch_size=len(batch),
+                error=str(e)
+            )
+            raise
     
     def embed_single(self, text: str) -> List[float]:
         """
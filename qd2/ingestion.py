@@ -334,11 +334,15 @@ class IngestionPipeline:
             Ingestion report
         """
         logger.info("Starting CGM ingestion", count=len(cgm_reports))
-        
+
         errors: List[IngestionError] = []
         skipped = 0
         point_ids = []
-        
+
+        # First pass: validate and render all reports so the summaries can
+        # be embedded in one batched API call instead of one call per report
+        prepared: List[Tuple[int, CGMInput, str, str, CGMPayload]] = []
+
         for idx, cgm in enumerate(cgm_reports):
             # Validate patient_id
             valid, error = self._validate_patient_id(
@@ -350,7 +354,7 @@ class IngestionPipeline:
                 errors.append(error)
                 skipped += 1
                 continue
-            
+
             try:
                 # Generate point ID
                 point_id = make_cgm_point_id(
@@ -359,41 +363,64 @@ class IngestionPipeline:
                     cgm.start_date,
                     cgm.end_date
                 )
-                
+
                 # Render summary text
                 summary_text = render_cgm_summary(cgm)
-                
+
                 # Create payload
                 payload = cgm_to_payload(cgm, summary_text)
-                
-                # Embed summary
-                try:
-                    vector = self.embedding_service.embed_single(summary_text)
-                except Exception as e:
-                    logger.error(
-                        "CGM embedding failed",
-                        doc_index=idx,
-                        patient_id=cgm.patient_id,
-                        error=str(e)
-                    )
+
+                prepared.append((idx, cgm, point_id, summary_text, payload))
+
+            except Exception as e:
+                logger.error(
+                    "CGM report preparation failed",
+                    doc_index=idx,
+                    patient_id=cgm.patient_id,
+                    error=str(e)
+                )
+                errors.append(IngestionError(
+                    doc_index=idx,
+                    patient_id=cgm.patient_id,
+                    reason=f"Ingestion error: {str(e)}",
+                    source=Source.CGM
+                ))
+                skipped += 1
+
+        # Embed all summaries at once (batched + cached by the service)
+        vectors: List[List[float]] = []
+        if prepared:
+            try:
+                vectors = self.embedding_service.embed_texts(
+                    [summary_text for _, _, _, summary_text, _ in prepared]
+                )
+            except Exception as e:
+                logger.error(
+                    "CGM embedding failed",
+                    count=len(prepared),
+                    error=str(e)
+                )
+                for idx, cgm, _, _, _ in prepared:
                     errors.append(IngestionError(
                         doc_index=idx,
                         patient_id=cgm.patient_id,
                         reason=f"Embedding error: {str(e)}",
                         source=Source.CGM
                     ))
-                    skipped += 1
-                    continue
-                
-                # Upsert to Qdrant
+                skipped += len(prepared)
+                prepared = []
+
+        # Second pass: upsert each report with its vector
+        for (idx, cgm, point_id, summary_text, payload), vector in zip(prepared, vectors):
+            try:
                 self.qdrant_manager.upsert_cgm_point(
                     point_id=point_id,
                     vector=vector,
                     payload=payload.model_dump(mode="json", exclude_none=False)
                 )
-                
+
                 point_ids.append(point_id)
-                
+
                 logger.info(
                     "CGM report ingested",
                     doc_index=idx,
@@ -401,7 +428,7 @@ class IngestionPipeline:
                     point_id=point_id,
                     report_type=cgm.report_type
                 )
-            
+
             except Exception as e:
                 logger.error(
                     "CGM ingestion failed",
@@ -416,7 +443,7 @@ class IngestionPipeline:
                     source=Source.CGM
                 ))
                 skipped += 1
-        
+
         return {
             "accepted": len(cgm_reports) - skipped,
             "indexed_points": len(point_ids),
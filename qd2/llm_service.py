@@ -1,57 +1,20 @@
 """LLM service for RAG answer generation."""
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any
-from openai import OpenAI
+from openai_client import get_openai_client
 from config import settings
 import structlog
 
 logger = structlog.get_logger()
 
 
-class LLMService:
-    """Service for generating RAG answers using LLM."""
-    
-    def __init__(self):
-        """Initialize OpenAI client."""
-        self.client = OpenAI(api_key=settings.openai_api_key)
-        self.model = settings.openai_llm_model
-        self.temperature = settings.openai_llm_temperature
-        self.max_tokens = settings.openai_llm_max_tokens
-    
-    def generate_answer(
-        self,
-        question: str,
-        evidence: List[Dict[str, Any]],
-        person_name: str
-    ) -> str:
-        """
-        Generate answer from question and retrieved evidence.
-        
-        Args:
-            question: User's natural language question
-            evidence: List of evidence chunks from vector search
-            person_name: Name of the person being queried
-            
-        Returns:
-            LLM-generated answer grounded in evidence
-        """
-        # Build context from evidence
-        context_parts = []
-        for idx, item in enumerate(evidence, 1):
-            payload = item.get("payload", {})
-            text = payload.get("text", "")
-            source = payload.get("source", "unknown")
-            date = payload.get("date", "unknown date")
-            patient_id = payload.get("patient_id", "unknown")
-            
-            context_parts.append(
-                f"[Evidence {idx}] (patient_id: {patient_id}, source: {source}, date: {date})\n{text}\n"
-            )
-        
-        context = "\n".join(context_parts)
-        
-        # Build system prompt with guardrails
-        system_prompt = f"""You are a helpful assistant that answers questions about patient health data.
+# Static portions of the system prompt, built once at import time so each
+# request only pays for concatenating the evidence context between them.
+_SYSTEM_PROMPT_PREFIX = """You are a helpful assistant that answers questions about patient health data.
 
 CRITICAL RULES:
 1. Answer STRICTLY based on the provided evidence context below
@@ -76,11 +39,180 @@ FORMATTING INSTRUCTIONS:
 - Structure your answer clearly with proper spacing
 
 EVIDENCE CONTEXT:
-{context}
+"""
+
+_SYSTEM_PROMPT_SUFFIX = """
 
 Answer the user's question based on this evidence. Provide whatever relevant information you can find, even if it's partial."""
 
+
+class _RateLimiter:
+    """
+    Thread-safe token-bucket limiter for outbound API requests.
+
+    Smooths bursts into a steady requests-per-minute rate so traffic
+    spikes queue client-side instead of bouncing off HTTP 429s.
+    """
+
+    def __init__(self, rpm: int):
+        """
+        Args:
+            rpm: Maximum requests per minute (bucket capacity)
+        """
+        self.rate = rpm / 60.0
+        self.capacity = float(rpm)
+        self.tokens = float(rpm)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request slot is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class LLMService:
+    """Service for generating RAG answers using LLM."""
+
+    def __init__(self):
+        """Initialize with the shared OpenAI client."""
+        self.client = get_openai_client()
+        self.model = settings.openai_llm_model
+        self.temperature = settings.openai_llm_temperature
+        self.max_tokens = settings.openai_llm_max_tokens
+
+        # Answer cache keyed by (model, full prompt, question). The key
+        # includes the evidence context, so a hit means the exact same
+        # question over the exact same retrieved data - safe to replay.
+        self.cache_ttl = settings.llm_cache_ttl_seconds
+        self.cache_size = settings.llm_cache_size
+        self._cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        # Guards expiry/move_to_end/evict compounds against concurrent
+        # request threads hitting this singleton
+        self._cache_lock = threading.Lock()
+
+        # Client-side admission control (0 = disabled, rely on SDK retries)
+        self._limiter = (
+            _RateLimiter(settings.openai_llm_rpm)
+            if settings.openai_llm_rpm > 0 else None
+        )
+
+    def _cached_answer(self, key: str) -> str | None:
+        """Return a cached answer if present and not expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, answer = entry
+            if time.monotonic() >= expires_at:
+                self._cache.pop(key, None)
+                return None
+            self._cache.move_to_end(key)
+            return answer
+
+    def _store_answer(self, key: str, answer: str) -> None:
+        """Cache an answer, evicting oldest entries past capacity."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, answer)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _cache_key(self, system_prompt: str, question: str) -> str | None:
+        """Build the cache key, or None when caching is disabled."""
+        if self.cache_ttl <= 0 or self.cache_size <= 0:
+            return None
+        return hashlib.sha256(
+            f"{self.model}|{system_prompt}|{question}".encode()
+        ).hexdigest()
+
+    def _build_system_prompt(self, evidence: List[Dict[str, Any]]) -> str:
+        """
+        Assemble the guardrail prompt around the evidence context.
+
+        The context is capped at llm_context_char_budget characters.
+        Evidence arrives score-sorted from retrieval, so when the budget
+        is hit the lowest-ranked items are the ones dropped.
+        """
+        budget = settings.llm_context_char_budget
+        context_parts = []
+        used = 0
+
+        for idx, item in enumerate(evidence, 1):
+            payload = item.get("payload", {})
+            text = payload.get("text", "")
+            source = payload.get("source", "unknown")
+            date = payload.get("date", "unknown date")
+            patient_id = payload.get("patient_id", "unknown")
+
+            part = (
+                f"[Evidence {idx}] (patient_id: {patient_id}, source: {source}, date: {date})\n{text}\n"
+            )
+
+            # Always keep at least one item so the model has something to ground on
+            if budget > 0 and context_parts and used + len(part) > budget:
+                logger.info(
+                    "Evidence context truncated to budget",
+                    included=len(context_parts),
+                    total=len(evidence),
+                    budget_chars=budget
+                )
+                break
+
+            context_parts.append(part)
+            used += len(part)
+
+        context = "\n".join(context_parts)
+
+        # Static parts precomputed at module load
+        return _SYSTEM_PROMPT_PREFIX + context + _SYSTEM_PROMPT_SUFFIX
+    
+    def generate_answer(
+        self,
+        question: str,
+        evidence: List[Dict[str, Any]],
+        person_name: str
+    ) -> str:
+        """
+        Generate answer from question and retrieved evidence.
+        
+        Args:
+            question: User's natural language question
+            evidence: List of evidence chunks from vector search
+            person_name: Name of the person being queried
+            
+        Returns:
+            LLM-generated answer grounded in evidence
+        """
+        system_prompt = self._build_system_prompt(evidence)
+
+        # Serve repeated question+evidence combinations from cache
+        cache_key = self._cache_key(system_prompt, question)
+        if cache_key is not None:
+            cached = self._cached_answer(cache_key)
+            if cached is not None:
+                logger.info(
+                    "LLM answer served from cache",
+                    question_length=len(question),
+                    evidence_count=len(evidence)
+                )
+                return cached
+
         try:
+            if self._limiter is not None:
+                self._limiter.acquire()
+
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -92,7 +224,10 @@ Answer the user's question based on this evidence. Provide whatever relevant inf
             )
             
             answer = response.choices[0].message.content.strip()
-            
+
+            if cache_key is not None:
+                self._store_answer(cache_key, answer)
+
             logger.info(
                 "Generated LLM answer",
                 question_length=len(question),
@@ -106,3 +241,79 @@ Answer the user's question based on this evidence. Provide whatever relevant inf
             logger.error("LLM answer generation failed", error=str(e))
             return f"Error generating answer: {str(e)}"
 
+    def generate_answer_stream(
+        self,
+        question: str,
+        evidence: List[Dict[str, Any]],
+        person_name: str
+    ):
+        """
+        Generate an answer as a stream of text fragments.
+
+        Same prompt and guardrails as generate_answer, but yields deltas
+        as the model produces them so callers can forward tokens to the
+        client at first-token latency. The full answer is cached on
+        completion, and cache hits are yielded as a single fragment.
+
+        Args:
+            question: User's natural language question
+            evidence: List of evidence chunks from vector search
+            person_name: Name of the person being queried
+
+        Yields:
+            Answer text fragments
+        """
+        system_prompt = self._build_system_prompt(evidence)
+
+        cache_key = self._cache_key(system_prompt, question)
+        if cache_key is not None:
+            cached = self._cached_answer(cache_key)
+            if cached is not None:
+                logger.info(
+                    "LLM answer served from cache",
+                    question_length=len(question),
+                    evidence_count=len(evidence)
+                )
+                yield cached
+                return
+
+        try:
+            if self._limiter is not None:
+                self._limiter.acquire()
+
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": question}
+                ],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stream=True
+            )
+
+            parts: List[str] = []
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+            answer = "".join(parts).strip()
+
+            if cache_key is not None and answer:
+                self._store_answer(cache_key, answer)
+
+            logger.info(
+                "Streamed LLM answer",
+                question_length=len(question),
+                evidence_count=len(evidence),
+                answer_length=len(answer)
+            )
+
+        except Exception as e:
+            logger.error("LLM answer streaming failed", error=str(e))
+            yield f"Error generating answer: {str(e)}"
+
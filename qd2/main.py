@@ -2,10 +2,11 @@
 
 from fastapi import FastAPI, HTTPException, status, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from typing import List, Optional
 import structlog
 from pathlib import Path
+import asyncio
 import json
 import tempfile
 
@@ -36,7 +37,8 @@ logger = structlog.get_logger()
 app = FastAPI(
     title="Patient Data RAG API",
     description="Retrieval-Augmented Generation over patient health data using Qdrant",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # C-accelerated JSON serialization
 )
 
 # Add CORS middleware
@@ -182,7 +184,7 @@ async def ingest_profiles(profiles: List[ProfileInput]):
     
     try:
         services = get_services()
-        result = services["ingestion"].ingest_profiles(profiles)
+        result = await asyncio.to_thread(services["ingestion"].ingest_profiles, profiles)
         return result
     except Exception as e:
         logger.error("Profile ingestion failed", error=str(e))
@@ -210,7 +212,7 @@ async def ingest_meals(meals: List[MealInput]):
     
     try:
         services = get_services()
-        result = services["ingestion"].ingest_meals(meals)
+        result = await asyncio.to_thread(services["ingestion"].ingest_meals, meals)
         return result
     except Exception as e:
         logger.error("Meals ingestion failed", error=str(e))
@@ -240,7 +242,8 @@ async def ingest_fitness(
     
     try:
         services = get_services()
-        result = services["ingestion"].ingest_fitness(
+        result = await asyncio.to_thread(
+            services["ingestion"].ingest_fitness,
             fitness_reports,
             include_hourly=include_hourly
         )
@@ -268,7 +271,7 @@ async def ingest_sleep(sleep_reports: List[SleepInput]):
     
     try:
         services = get_services()
-        result = services["ingestion"].ingest_sleep(sleep_reports)
+        result = await asyncio.to_thread(services["ingestion"].ingest_sleep, sleep_reports)
         return result
     except Exception as e:
         logger.error("Sleep ingestion failed", error=str(e))
@@ -295,7 +298,7 @@ async def ingest_cgm(cgm_reports: List[CGMInput]):
     
     try:
         services = get_services()
-        result = services["ingestion"].ingest_cgm(cgm_reports)
+        result = await asyncio.to_thread(services["ingestion"].ingest_cgm, cgm_reports)
         return result
     except Exception as e:
         logger.error("CGM ingestion failed", error=str(e))
@@ -340,11 +343,11 @@ async def ingest_profile_file(file: UploadFile = File(...)):
         # Convert to ProfileInput models
         profiles = [ProfileInput(**profile) for profile in profiles_data]
         
-        # Ingest
+        # Ingest (off the event loop - embedding + upsert is blocking work)
         services = get_services()
-        result = services["ingestion"].ingest_profiles(profiles)
-        
-        logger.info("Profile file ingested successfully", 
+        result = await asyncio.to_thread(services["ingestion"].ingest_profiles, profiles)
+
+        logger.info("Profile file ingested successfully",
                    filename=file.filename, 
                    records=len(profiles),
                    indexed=result["indexed_points"])
@@ -390,9 +393,9 @@ async def ingest_meals_file(file: UploadFile = File(...)):
         meals = [MealInput(**meal) for meal in meals_data]
         
         services = get_services()
-        result = services["ingestion"].ingest_meals(meals)
-        
-        logger.info("Meals file ingested successfully", 
+        result = await asyncio.to_thread(services["ingestion"].ingest_meals, meals)
+
+        logger.info("Meals file ingested successfully",
                    filename=file.filename, 
                    records=len(meals),
                    indexed=result["indexed_points"])
@@ -442,12 +445,13 @@ async def ingest_fitness_file(
         fitness_reports = [FitnessInput(**report) for report in fitness_data]
         
         services = get_services()
-        result = services["ingestion"].ingest_fitness(
+        result = await asyncio.to_thread(
+            services["ingestion"].ingest_fitness,
             fitness_reports,
             include_hourly=include_hourly
         )
-        
-        logger.info("Fitness file ingested successfully", 
+
+        logger.info("Fitness file ingested successfully",
                    filename=file.filename, 
                    records=len(fitness_reports),
                    indexed=result["indexed_points"])
@@ -493,9 +497,9 @@ async def ingest_sleep_file(file: UploadFile = File(...)):
         sleep_reports = [SleepInput(**report) for report in sleep_data]
         
         services = get_services()
-        result = services["ingestion"].ingest_sleep(sleep_reports)
-        
-        logger.info("Sleep file ingested successfully", 
+        result = await asyncio.to_thread(services["ingestion"].ingest_sleep, sleep_reports)
+
+        logger.info("Sleep file ingested successfully",
                    filename=file.filename, 
                    records=len(sleep_reports),
                    indexed=result["indexed_points"])
@@ -577,9 +581,9 @@ async def ingest_cgm_file(file: UploadFile = File(...)):
         cgm_reports = [CGMInput(**report) for report in cgm_data]
         
         services = get_services()
-        result = services["ingestion"].ingest_cgm(cgm_reports)
-        
-        logger.info("CGM file ingested successfully", 
+        result = await asyncio.to_thread(services["ingestion"].ingest_cgm, cgm_reports)
+
+        logger.info("CGM file ingested successfully",
                    filename=file.filename, 
                    records=len(cgm_reports),
                    indexed=result["indexed_points"])
@@ -627,7 +631,8 @@ async def query(request: QueryRequest):
     """
     try:
         services = get_services()
-        result = services["retrieval"].query(request)
+        # Embed + search + LLM round-trip is blocking; keep it off the loop
+        result = await asyncio.to_thread(services["retrieval"].query, request)
         return result
     except Exception as e:
         logger.error("Query execution failed", error=str(e))
@@ -637,6 +642,33 @@ async def query(request: QueryRequest):
         )
 
 
+@app.post("/query/stream")
+async def query_stream(request: QueryRequest):
+    """
+    Execute RAG query and stream the answer as Server-Sent Events.
+
+    Retrieval runs exactly as in /query; the LLM answer is then streamed
+    token by token, so clients see output at first-token latency instead
+    of waiting for the full generation.
+
+    Each SSE frame carries a JSON-encoded text fragment; the stream ends
+    with a `data: [DONE]` frame.
+    """
+    services = get_services()
+
+    def event_source():
+        try:
+            for fragment in services["retrieval"].query_stream(request):
+                yield f"data: {json.dumps(fragment)}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            logger.error("Streaming query failed", error=str(e))
+            yield f"data: {json.dumps(f'Query failed: {str(e)}')}\n\n"
+            yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_source(), media_type="text/event-stream")
+
+
 # ============================================================================
 # Management Endpoints
 # ============================================================================
@@ -675,6 +707,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=port,
         reload=False,  # Disable reload in production
+        loop="uvloop",      # C event loop (bundled via uvicorn[standard])
+        http="httptools",   # C HTTP parser
         log_level=settings.log_level.lower()
     )
 
@@ -0,0 +1,24 @@
+"""Shared OpenAI client for embedding and LLM services."""
+
+from functools import lru_cache
+from openai import OpenAI
+from config import settings
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Return the process-wide OpenAI client.
+
+    Embeddings and chat completions go to the same API host, so sharing
+    one client lets both reuse a single HTTP connection pool instead of
+    each service paying its own TLS handshakes.
+
+    Returns:
+        Singleton OpenAI client
+    """
+    return OpenAI(
+        api_key=settings.openai_api_key,
+        timeout=120.0,  # 2 minutes timeout
+        max_retries=3   # Retry 3 times on failure
+    )
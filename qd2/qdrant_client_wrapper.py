@@ -5,32 +5,40 @@ from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance, VectorParams, PointStruct,
     Filter, FieldCondition, MatchValue, Range,
-    PayloadSchemaType, CreateCollection
+    PayloadSchemaType, CreateCollection,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+    HnswConfigDiff
 )
 from models import ProcessedChunk, Source
 from config import settings
+from functools import lru_cache
 import structlog
 import uuid
 
 logger = structlog.get_logger()
 
+# Namespace UUID for point-ID derivation (DNS namespace; any valid UUID works)
+_POINT_ID_NAMESPACE = uuid.UUID('6ba7b810-9dad-11d1-80b4-00c04fd430c8')
 
+
+@lru_cache(maxsize=65536)
 def stable_id_to_uuid(stable_id: str) -> str:
     """
     Convert a stable string ID to a deterministic UUID.
-    
+
     Uses UUID v5 (SHA-1 hashing) to generate a valid UUID from any string.
     Same input always produces the same UUID (idempotent).
-    
+
+    Memoized: re-ingests and retries hit the same stable IDs repeatedly,
+    so repeat calls skip the SHA-1 + UUID formatting entirely.
+
     Args:
         stable_id: String ID like "meals:patient-id:2025-05-02:summary"
-        
+
     Returns:
         UUID string
     """
-    # Use a namespace UUID (can be any valid UUID)
-    namespace = uuid.UUID('6ba7b810-9dad-11d1-80b4-00c04fd430c8')  # DNS namespace
-    return str(uuid.uuid5(namespace, stable_id))
+    return str(uuid.uuid5(_POINT_ID_NAMESPACE, stable_id))
 
 
 class QdrantManager:
@@ -75,22 +83,41 @@ class QdrantManager:
         Collection config:
         - Vectors: 1536-dim (OpenAI text-embedding-3-small)
         - Distance: COSINE
+        - Optional int8 scalar quantization (~4x less vector RAM/bandwidth)
+        - Tunable HNSW graph (m / ef_construct) for recall vs latency
         """
         collections = self.client.get_collections().collections
         collection_names = [col.name for col in collections]
-        
+
         if self.collection_name not in collection_names:
             logger.info(
                 "Creating Qdrant collection",
                 collection=self.collection_name,
-                vector_size=self.vector_size
+                vector_size=self.vector_size,
+                quantization=settings.qdrant_use_quantization
             )
-            
+
+            # int8 scalar quantization keeps originals on disk for rescoring,
+            # so recall impact stays negligible while search reads 1/4 the bytes
+            quantization_config = None
+            if settings.qdrant_use_quantization:
+                quantization_config = ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        always_ram=True
+                    )
+                )
+
             self.client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(
                     size=self.vector_size,
                     distance=Distance.COSINE
+                ),
+                quantization_config=quantization_config,
+                hnsw_config=HnswConfigDiff(
+                    m=settings.qdrant_hnsw_m,
+                    ef_construct=settings.qdrant_hnsw_ef_construct
                 )
             )
             
@@ -169,7 +196,9 @@ class QdrantManager:
             return 0
         
         # Batch upsert for large datasets to avoid timeout
-        batch_size = 100
+        # Batch size is configurable (INGEST_BATCH_SIZE env var) to keep
+        # per-request HNSW work bounded on large ingests
+        batch_size = settings.ingest_batch_size
         total_upserted = 0
         
         for i in range(0, len(points), batch_size):
@@ -270,14 +299,15 @@ class QdrantManager:
             limit=limit
         )
         
-        # Format results
-        formatted_results = []
-        for result in results:
-            formatted_results.append({
+        # Format results in a single pass
+        formatted_results = [
+            {
                 "score": result.score,
                 "payload": result.payload,
                 "id": result.id
-            })
+            }
+            for result in results
+        ]
         
         logger.info(
             "Search completed",
@@ -1,17 +1,33 @@
 """Retrieval workflow for RAG queries."""
 
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
+from qdrant_client.models import Filter, FieldCondition, MatchValue
 from models import QueryRequest, QueryResponse, EvidenceItem, Source
 from embedding_service import EmbeddingService
 from qdrant_client_wrapper import QdrantManager
 from llm_service import LLMService
-from utils import parse_to_utc_seconds
+from utils import parse_to_utc_seconds, is_valid_uuid
 #import psycopg2
 from config import settings
 import structlog
 
 logger = structlog.get_logger()
 
+# Profile chunk text starts with "Profile for {full_name} (ID: {patient_id}):".
+# Compiled once; used to pull the name out of lowercased payload text.
+_PROFILE_NAME_RE = re.compile(r"profile for (.+?) \(id:")
+
+# UUID format: 8-4-4-4-12 hexadecimal characters (compiled once, used to
+# spot patient IDs embedded anywhere in question text)
+_UUID_IN_TEXT_RE = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+)
+
 
 class RetrievalService:
     """Service for executing RAG retrieval workflows."""
@@ -33,7 +49,45 @@ class RetrievalService:
         self.embedding_service = embedding_service
         self.qdrant_manager = qdrant_manager
         self.llm_service = llm_service
-    
+
+        # Resolved-name cache: name resolution scrolls every profile chunk
+        # in Qdrant, so repeat queries for the same person would otherwise
+        # pay a full scan each time. Successful resolutions are kept for a
+        # short TTL; misses are never cached (the profile may arrive next).
+        self._name_cache_ttl = settings.name_resolution_cache_ttl_seconds
+        self._name_cache_size = settings.name_resolution_cache_size
+        self._name_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        # Guards expiry/move_to_end/evict compounds: concurrent queries
+        # for the same person hit this cache from multiple threads
+        self._name_cache_lock = threading.Lock()
+
+    def _cached_patient_id(self, search_name: str) -> Optional[str]:
+        """Return a cached name resolution if present and not expired."""
+        with self._name_cache_lock:
+            entry = self._name_cache.get(search_name)
+            if entry is None:
+                return None
+            expires_at, patient_id = entry
+            if time.monotonic() >= expires_at:
+                self._name_cache.pop(search_name, None)
+                return None
+            self._name_cache.move_to_end(search_name)
+            return patient_id
+
+    def _store_patient_id(self, search_name: str, patient_id: str) -> None:
+        """Cache a resolved name, evicting oldest entries past capacity."""
+        if self._name_cache_ttl <= 0 or self._name_cache_size <= 0:
+            return
+        with self._name_cache_lock:
+            self._name_cache[search_name] = (
+                time.monotonic() + self._name_cache_ttl,
+                patient_id
+            )
+            self._name_cache.move_to_end(search_name)
+            while len(self._name_cache) > self._name_cache_size:
+                self._name_cache.popitem(last=False)
+
+
     def _is_cross_domain_query(self, question: str) -> bool:
         """
         Detect if question mentions multiple data sources.
@@ -116,65 +170,78 @@ class RetrievalService:
             patient_id UUID string or None
         """
         person = person.strip()
-        
+
         # Check if already a UUID
-        from utils import is_valid_uuid
         if is_valid_uuid(person):
             return person
-        
+
         # Search Qdrant for profile data matching the name
         try:
-            from qdrant_client.models import Filter, FieldCondition, MatchValue
-            
-            # Scroll through profile records to find matching name
-            results = self.qdrant_manager.client.scroll(
-                collection_name=self.qdrant_manager.collection_name,
-                scroll_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="source",
-                            match=MatchValue(value="profile")
-                        )
-                    ]
-                ),
-                limit=1000,  # Get up to 1000 profiles
-                with_payload=True,
-                with_vectors=False
+            profile_filter = Filter(
+                must=[
+                    FieldCondition(
+                        key="source",
+                        match=MatchValue(value="profile")
+                    )
+                ]
             )
-            
+
             # Normalize search name for comparison
             search_name = person.lower().strip()
-            
-            # Search through profile text for matching names
-            for point in results[0]:
-                payload = point.payload
-                text = payload.get("text", "").lower()
-                patient_id = payload.get("patient_id")
-                
-                # Check if the search name appears in the profile text
-                # Profile text format: "Profile for {full_name} (ID: {patient_id}):"
-                if f"profile for {search_name}" in text:
-                    logger.info(
-                        "Name resolved to patient_id",
-                        person=person,
-                        patient_id=patient_id
-                    )
-                    return patient_id
-                
-                # Also check if it's a partial match (first name or last name)
-                # Extract name from text: "Profile for {name} (ID:"
-                if "profile for " in text and " (id:" in text:
-                    start = text.find("profile for ") + len("profile for ")
-                    end = text.find(" (id:", start)
-                    if start < end:
-                        full_name = text[start:end].strip()
+
+            # Serve recently resolved names without rescanning profiles
+            cached = self._cached_patient_id(search_name)
+            if cached is not None:
+                logger.info(
+                    "Name resolved from cache",
+                    person=person,
+                    patient_id=cached
+                )
+                return cached
+
+            # Scroll through profile records page by page, stopping at the
+            # first match. This bounds memory per page and removes the old
+            # 1000-profile ceiling.
+            offset = None
+
+            while True:
+                points, offset = self.qdrant_manager.client.scroll(
+                    collection_name=self.qdrant_manager.collection_name,
+                    scroll_filter=profile_filter,
+                    limit=256,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+
+                # Search through profile text for matching names
+                for point in points:
+                    payload = point.payload
+                    text = payload.get("text", "").lower()
+                    patient_id = payload.get("patient_id")
+
+                    # Check if the search name appears in the profile text
+                    # Profile text format: "Profile for {full_name} (ID: {patient_id}):"
+                    if f"profile for {search_name}" in text:
+                        logger.info(
+                            "Name resolved to patient_id",
+                            person=person,
+                            patient_id=patient_id
+                        )
+                        self._store_patient_id(search_name, patient_id)
+                        return patient_id
+
+                    # Also check if it's a partial match (first name or last name)
+                    match = _PROFILE_NAME_RE.search(text)
+                    if match:
+                        full_name = match.group(1).strip()
                         # Check if search name matches any part of the full name
                         name_parts = full_name.split()
                         search_parts = search_name.split()
-                        
+
                         # Match if any search part matches any name part
-                        if any(search_part in name_part or name_part in search_part 
-                               for search_part in search_parts 
+                        if any(search_part in name_part or name_part in search_part
+                               for search_part in search_parts
                                for name_part in name_parts):
                             logger.info(
                                 "Name partially resolved to patient_id",
@@ -182,8 +249,12 @@ class RetrievalService:
                                 matched_name=full_name,
                                 patient_id=patient_id
                             )
+                            self._store_patient_id(search_name, patient_id)
                             return patient_id
-            
+
+                if offset is None:
+                    break
+
             logger.warning(
                 "Person not found in profile data",
                 person=person,
@@ -238,13 +309,8 @@ class RetrievalService:
         Returns:
             Patient ID if found, None otherwise
         """
-        import re
-        from utils import is_valid_uuid
-        
         # Look for UUID pattern in the question
-        # UUID format: 8-4-4-4-12 hexadecimal characters
-        uuid_pattern = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
-        matches = re.findall(uuid_pattern, question.lower())
+        matches = _UUID_IN_TEXT_RE.findall(question.lower())
         
         if matches:
             # Return the first valid UUID found
@@ -259,22 +325,23 @@ class RetrievalService:
         
         return None
     
-    def query(self, request: QueryRequest) -> QueryResponse:
+    def _retrieve(self, request: QueryRequest) -> tuple:
         """
-        Execute RAG query workflow.
-        
+        Execute the retrieval half of the RAG workflow.
+
         Steps:
         1. Resolve person name to patient_id (optional - if not provided, searches all patients)
         2. Build metadata filter
         3. Embed query
         4. Vector search with filters
-        5. Generate LLM answer from evidence
-        
+
         Args:
             request: QueryRequest with question and filters
-            
+
         Returns:
-            QueryResponse with answer and evidence
+            Tuple of (evidence, query_metadata, error_answer). error_answer
+            is a user-facing message set only when retrieval could not run
+            (unknown person, embedding failure); evidence is empty then.
         """
         # Step 1: Resolve person (optional for cross-patient queries)
         patient_id = None
@@ -296,14 +363,14 @@ class RetrievalService:
                     person=request.person,
                     hint="Use exact patient_id (UUID) or check profile data ingestion"
                 )
-                return QueryResponse(
-                    answer=f"Could not find patient '{request.person}'. Please provide the patient_id directly (UUID format), or check that profile data with this name has been ingested.",
-                    evidence=[],
-                    query_metadata={
+                return (
+                    [],
+                    {
                         "person": request.person,
                         "resolved_patient_id": None,
                         "error": "Person not found - use patient_id (UUID) directly"
-                    }
+                    },
+                    f"Could not find patient '{request.person}'. Please provide the patient_id directly (UUID format), or check that profile data with this name has been ingested."
                 )
             
             logger.info(
@@ -333,18 +400,21 @@ class RetrievalService:
             end_ts = parse_to_utc_seconds(request.to_time)
         
         # Step 3: Embed query
+        # Collapse whitespace so trivially different phrasings of the same
+        # question share one embedding-cache entry (and one API call)
         try:
-            query_vector = self.embedding_service.embed_single(request.question)
+            normalized_question = " ".join(request.question.split())
+            query_vector = self.embedding_service.embed_single(normalized_question)
         except Exception as e:
             logger.error("Query embedding failed", error=str(e))
-            return QueryResponse(
-                answer=f"Error processing query: {str(e)}",
-                evidence=[],
-                query_metadata={
+            return (
+                [],
+                {
                     "person": request.person,
                     "patient_id": patient_id,
                     "error": "Embedding failed"
-                }
+                },
+                f"Error processing query: {str(e)}"
             )
         
         # Step 4: Vector search
@@ -365,9 +435,11 @@ class RetrievalService:
                 )
                 
                 per_source_limit = max(3, request.top_k // len(mentioned_sources))
-                
-                for source in mentioned_sources:
-                    source_results = self.qdrant_manager.search(
+
+                # The per-source searches are independent Qdrant calls;
+                # issue them concurrently instead of paying one RTT each
+                def search_source(source: Source) -> List[Dict[str, Any]]:
+                    return self.qdrant_manager.search(
                         query_vector=query_vector,
                         patient_id=patient_id,
                         source=source,
@@ -375,8 +447,11 @@ class RetrievalService:
                         end_ts=end_ts,
                         limit=per_source_limit
                     )
-                    search_results.extend(source_results)
-                
+
+                with ThreadPoolExecutor(max_workers=len(mentioned_sources)) as executor:
+                    for source_results in executor.map(search_source, mentioned_sources):
+                        search_results.extend(source_results)
+
                 # Sort by score and limit to top_k
                 search_results.sort(key=lambda x: x["score"], reverse=True)
                 search_results = search_results[:request.top_k]
@@ -401,16 +476,15 @@ class RetrievalService:
                 limit=request.top_k
             )
         
-        # Step 5: Format evidence
-        evidence = []
-        for result in search_results:
-            evidence.append(
-                EvidenceItem(
-                    score=result["score"],
-                    payload=result["payload"],
-                    text=result["payload"].get("text")
-                )
+        # Step 5: Format evidence in a single pass
+        evidence = [
+            EvidenceItem(
+                score=result["score"],
+                payload=result["payload"],
+                text=result["payload"].get("text")
             )
+            for result in search_results
+        ]
         
         # Log evidence retrieval details
         logger.info(
@@ -419,22 +493,7 @@ class RetrievalService:
             sources=[e.payload.get("source") for e in evidence[:5]] if evidence else [],
             dates=[e.payload.get("date") for e in evidence[:5]] if evidence else []
         )
-        
-        # Step 6: Generate answer
-        if not evidence:
-            if request.person:
-                answer = f"I don't have any data for {request.person} matching your query."
-            else:
-                answer = "I don't have any data matching your query criteria."
-        else:
-            person_name = request.person if request.person else "any patient"
-            # Use all evidence (up to 50) for LLM to generate comprehensive answer
-            answer = self.llm_service.generate_answer(
-                question=request.question,
-                evidence=[{"payload": e.payload} for e in evidence],
-                person_name=person_name
-            )
-        
+
         # Build metadata
         query_metadata = {
             "person": request.person,
@@ -447,7 +506,46 @@ class RetrievalService:
             "results_count": len(evidence),
             "displayed_evidence_count": min(5, len(evidence))
         }
-        
+
+        return evidence, query_metadata, None
+
+    def _no_data_answer(self, request: QueryRequest) -> str:
+        """Build the canned answer for queries with no matching evidence."""
+        if request.person:
+            return f"I don't have any data for {request.person} matching your query."
+        return "I don't have any data matching your query criteria."
+
+    def query(self, request: QueryRequest) -> QueryResponse:
+        """
+        Execute RAG query workflow (retrieval + LLM answer).
+
+        Args:
+            request: QueryRequest with question and filters
+
+        Returns:
+            QueryResponse with answer and evidence
+        """
+        evidence, query_metadata, error_answer = self._retrieve(request)
+
+        if error_answer is not None:
+            return QueryResponse(
+                answer=error_answer,
+                evidence=[],
+                query_metadata=query_metadata
+            )
+
+        # Generate answer
+        if not evidence:
+            answer = self._no_data_answer(request)
+        else:
+            person_name = request.person if request.person else "any patient"
+            # Use all evidence (up to 50) for LLM to generate comprehensive answer
+            answer = self.llm_service.generate_answer(
+                question=request.question,
+                evidence=[{"payload": e.payload} for e in evidence],
+                person_name=person_name
+            )
+
         # Return only top 5 evidence items for display, but LLM used all available chunks
         return QueryResponse(
             answer=answer,
@@ -455,3 +553,34 @@ class RetrievalService:
             query_metadata=query_metadata
         )
 
+    def query_stream(self, request: QueryRequest):
+        """
+        Execute RAG query workflow, yielding the answer incrementally.
+
+        Retrieval runs up front exactly as in query(); the LLM answer is
+        then streamed token by token so clients see output at first-token
+        latency instead of full-generation latency.
+
+        Args:
+            request: QueryRequest with question and filters
+
+        Yields:
+            Answer text fragments
+        """
+        evidence, _, error_answer = self._retrieve(request)
+
+        if error_answer is not None:
+            yield error_answer
+            return
+
+        if not evidence:
+            yield self._no_data_answer(request)
+            return
+
+        person_name = request.person if request.person else "any patient"
+        yield from self.llm_service.generate_answer_stream(
+            question=request.question,
+            evidence=[{"payload": e.payload} for e in evidence],
+            person_name=person_name
+        )
+
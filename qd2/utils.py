@@ -2,6 +2,7 @@
 
 from datetime import datetime, timezone
 from dateutil import parser
+from functools import lru_cache
 from typing import Any, Optional, Tuple
 import re
 
@@ -99,13 +100,16 @@ def extract_date_from_timestamp(ts: Optional[int]) -> Optional[str]:
 # Name normalization
 # ============================================================================
 
+@lru_cache(maxsize=65536)
 def normalize_name(name: Optional[str]) -> Optional[str]:
     """
     Normalize name by stripping whitespace and handling None.
-    
+
+    Memoized: bulk re-ingests see the same names over and over.
+
     Args:
         name: Input name string
-        
+
     Returns:
         Normalized name or None
     """
@@ -116,10 +120,13 @@ def normalize_name(name: Optional[str]) -> Optional[str]:
     return normalized if normalized else None
 
 
+@lru_cache(maxsize=65536)
 def build_full_name(first_name: Optional[str], last_name: Optional[str]) -> Optional[str]:
     """
     Build full name from first and last names.
-    
+
+    Memoized alongside normalize_name for repeat patients.
+
     Args:
         first_name: First name
         last_name: Last name
@@ -144,12 +151,15 @@ def build_full_name(first_name: Optional[str], last_name: Optional[str]) -> Opti
 # Health metrics
 # ============================================================================
 
+@lru_cache(maxsize=65536)
 def calculate_bmi(height_cm: Optional[float], weight_kg: Optional[float]) -> Optional[float]:
     """
     Calculate BMI from height and weight with outlier guards.
-    
+
     BMI = weight (kg) / (height (m))^2
-    
+
+    Memoized: patient revisions repeat the same (height, weight) pairs.
+
     Outlier guards:
     - Height: 50-250 cm
     - Weight: 2-500 kg
@@ -265,13 +275,17 @@ def safe_str(value: Any, default: str = "N/A") -> str:
 # Validation
 # ============================================================================
 
+# Compiled once at import; is_valid_uuid runs on every document of every
+# ingest batch, so per-call re.compile churn adds up
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    re.IGNORECASE
+)
+
+
 def is_valid_uuid(value: str) -> bool:
     """Check if string is a valid UUID."""
-    uuid_pattern = re.compile(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-        re.IGNORECASE
-    )
-    return bool(uuid_pattern.match(value))
+    return bool(_UUID_RE.match(value))
 
 
 def validate_required_fields(data: dict, required: list, source: str) -> Optional[str]: